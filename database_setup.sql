@@ -1,4 +1,5 @@
 -- Drop existing tables in reverse order of dependencies
+DROP TABLE IF EXISTS deletionoutbox CASCADE;
 DROP TABLE IF EXISTS newsinteractions CASCADE;
 DROP TABLE IF EXISTS newsassettags CASCADE;
 DROP TABLE IF EXISTS news CASCADE;
@@ -15,7 +16,8 @@ CREATE TABLE users (
     username VARCHAR(100) NOT NULL UNIQUE,
     password VARCHAR(255) NOT NULL,
     email VARCHAR(100) NOT NULL UNIQUE,
-    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    deletedat TIMESTAMP
 );
 
 -- Portfolios Table
@@ -23,7 +25,8 @@ CREATE TABLE portfolios (
     portfolioid SERIAL PRIMARY KEY,
     userid INTEGER NOT NULL REFERENCES users(userid) ON DELETE CASCADE,
     portfolioname VARCHAR(100) NOT NULL,
-    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    deletedat TIMESTAMP
 );
 
 -- Assets Table
@@ -93,10 +96,21 @@ CREATE TABLE newsinteractions (
     PRIMARY KEY (newsid, userid)
 );
 
+-- Deletion Outbox Table
+-- Soft-deleted users/portfolios waiting for their dependent rows to be purged in batches
+CREATE TABLE deletionoutbox (
+    outboxid SERIAL PRIMARY KEY,
+    entitytype VARCHAR(20) NOT NULL CHECK (entitytype IN ('user', 'portfolio')),
+    entityid INTEGER NOT NULL,
+    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    processedat TIMESTAMP
+);
+
 -- Create indexes for better query performance
 CREATE INDEX idx_portfolios_userid ON portfolios(userid);
 CREATE INDEX idx_portfolioassets_assetid ON portfolioassets(assetid);
 CREATE INDEX idx_pricehistory_timestamp ON pricehistory(timestamp);
 CREATE INDEX idx_news_publishedat ON news(publishedat);
 CREATE INDEX idx_newsassettags_assetid ON newsassettags(assetid);
-CREATE INDEX idx_newsinteractions_userid ON newsinteractions(userid); 
\ No newline at end of file
+CREATE INDEX idx_newsinteractions_userid ON newsinteractions(userid);
+CREATE INDEX idx_deletionoutbox_pending ON deletionoutbox(outboxid) WHERE processedat IS NULL;
\ No newline at end of file
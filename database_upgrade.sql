@@ -0,0 +1,19 @@
+-- Upgrade an existing database to the current schema without losing data.
+-- Safe to run more than once.
+--   psql -d portfoliovantage -f database_upgrade.sql
+
+-- Soft delete for users and portfolios
+ALTER TABLE users ADD COLUMN IF NOT EXISTS deletedat TIMESTAMP;
+ALTER TABLE portfolios ADD COLUMN IF NOT EXISTS deletedat TIMESTAMP;
+
+-- Deletion Outbox Table
+-- Soft-deleted users/portfolios waiting for their dependent rows to be purged in batches
+CREATE TABLE IF NOT EXISTS deletionoutbox (
+    outboxid SERIAL PRIMARY KEY,
+    entitytype VARCHAR(20) NOT NULL CHECK (entitytype IN ('user', 'portfolio')),
+    entityid INTEGER NOT NULL,
+    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    processedat TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_deletionoutbox_pending ON deletionoutbox(outboxid) WHERE processedat IS NULL;
@@ -6,7 +6,13 @@ import numpy as np
 import pandas as pd
 import os
 from psycopg2.extras import execute_values
-import bcrypt  # Secure password hashing
+import django
+
+# Hash passwords with the app's configured hasher so dummy users can log in
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "myproject.settings")
+django.setup()
+
+from myapp.provisioning import hash_passwords
 
 
 # Database connection parameters
@@ -39,31 +45,30 @@ SENTIMENTS = ["Ultra-Bullish", "Positive", "Neutral", "Negative", "Ultra-Bearish
 def connect_db():
     return psycopg2.connect(**DB_PARAMS)
 
-#Hashes a password using bcrypt for security.
-def hash_password(password):
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-
 #Creates dummy users with hashed passwords and stores them in the database.
+#Passwords are hashed across a process pool (cost set by PASSWORD_HASH_ITERATIONS)
+#and all users are inserted in one batch.
 def create_users(conn, num_users=5):
+    usernames = [f"user{i+1}" for i in range(num_users)]
+    passwords = [f"password{i+1}" for i in range(num_users)]
+
+    hashed_passwords = hash_passwords(passwords)
+
     with conn.cursor() as cur:
-        users_data = []
-        user_ids = []
-        for i in range(num_users):
-            username = f"user{i+1}"
-            cur.execute("""
-                INSERT INTO users (username, password, email)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (username) DO NOTHING
-                RETURNING userid;
-            """, (username, hash_password(f"password{i+1}"), f"{username}@example.com"))
-            result = cur.fetchone()
-            if result:
-                user_ids.append(result[0])
-            else:
-                # If user already exists, get their ID
-                cur.execute("SELECT userid FROM users WHERE username = %s", (username,))
-                user_ids.append(cur.fetchone()[0])
-        return user_ids
+        users_data = [
+            (username, hashed, f"{username}@example.com")
+            for username, hashed in zip(usernames, hashed_passwords)
+        ]
+        execute_values(cur, """
+            INSERT INTO users (username, password, email)
+            VALUES %s
+            ON CONFLICT (username) DO NOTHING
+        """, users_data)
+
+        # Fetch IDs for both new and already existing users
+        cur.execute("SELECT username, userid FROM users WHERE username = ANY(%s)", (usernames,))
+        ids_by_username = dict(cur.fetchall())
+        return [ids_by_username[username] for username in usernames]
 
 def generate_gbm(start_price, mu, sigma, T, dt):
     """